@@ -15,6 +15,16 @@ class CursorDebugWrapper(ReconnectingCursorMixin, BaseCursorDebugWrapper):
 
 
 class DatabaseWrapper(PGSQLDatabaseWrapper):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reconnect_count = 0
+
+    def is_connection_lost(self) -> bool:
+        """
+        Whether psycopg2 noticed that the connection to the server is gone, checked without a query
+        """
+        return self.connection is None or self.connection.closed != 0
+
     @async_unsafe
     def _reconnect(self):
         try:
@@ -27,6 +37,9 @@ class DatabaseWrapper(PGSQLDatabaseWrapper):
 
         self.ensure_connection()
 
+        self.reconnect_count += 1
+        logging.warning("Reconnected database connection %r (%d reconnects)", self.alias, self.reconnect_count)
+
     @async_unsafe
     def create_cursor(self, name=None):
         try:
@@ -1,12 +1,22 @@
+import random
+import time
 from django.db.utils import OperationalError
 
 
+# Upper bound of the random delay before reconnecting, so workers losing their connections at once do not reconnect in lockstep
+RECONNECT_JITTER = 0.05
+
+
 class ReconnectingCursorMixin:
     def _execute_with_wrappers(self, sql, params, many, executor):
         try:
             return super()._execute_with_wrappers(sql, params, many, executor)
 
         except OperationalError as error:
+            # Only lost connections wait, other errors (e.g. deadlocks or statement timeouts) are retried right away
+            if self.db.is_connection_lost():
+                time.sleep(random.uniform(0, RECONNECT_JITTER))
+
             self.db._reconnect()
             self.cursor.close()
             self.cursor = self.db.create_cursor()
@@ -1,23 +1,69 @@
 import logging
-from typing import Tuple, Type, TypeVar, Union, TYPE_CHECKING
-from functools import partial
-from kombu import Exchange, Connection
+import threading
+from operator import attrgetter
+from typing import Callable, Optional, Tuple, Type, TypeVar, Union, TYPE_CHECKING
+from kombu import Exchange, Connection, Producer
 from pydantic import BaseModel
+from pydantic.json import pydantic_encoder
 from django.dispatch import receiver, Signal
 from django.db.models.signals import post_save, post_delete
 from django.db import models
 from ..utils.pydantic_django import transfer_from_orm
+from ..utils.pydantic_django.plan import get_read_plan, KIND_SCALAR, KIND_SCALAR_RUN
 from ..utils.sentry import instrument_span, span as span_ctx, capture_exception
 from ..schemas import DataChangeEvent, EventMetadata
 from ..utils.typing import with_typehint
 from ..utils.django import on_transaction_complete
 
+try:
+    import orjson
+
+except ImportError:
+    orjson = None
+
 
 TBaseModel = TypeVar('TBaseModel', bound=BaseModel)
 TDjangoModel = TypeVar('TDjangoModel', bound=models.Model)
 
+# Producers are cached per thread, as kombu channels must not be shared between threads
+_local = threading.local()
+
+
+def _get_scalar_extractor(schema: Type[BaseModel]) -> Optional[Callable[[models.Model], dict]]:
+    """
+    Returns a function reading the schema's values from a django object by attribute access, for schemas where
+    transfer_from_orm would only copy plain model fields. Returns None if any field needs the generic transfer.
+    """
+    steps, fields_set = get_read_plan(schema)
+    if not steps or len(fields_set) != len(schema.__fields__):
+        # Fields skipped by the read plan get their default from the schema
+        return None
+
+    names = []
+    attnames = []
+    for step in steps:
+        if step.kind == KIND_SCALAR_RUN:
+            names.extend(step.names)
+            attnames.extend(step.attnames)
+
+        elif step.kind == KIND_SCALAR:
+            names.append(step.name)
+            attnames.append(step.attname)
+
+        else:
+            return None
+
+    aliases = [schema.__fields__[name].alias for name in names]
+    getter = attrgetter(*attnames)
+    if len(attnames) == 1:
+        return lambda django_obj: {aliases[0]: getter(django_obj)}
+
+    return lambda django_obj: dict(zip(aliases, getter(django_obj)))
+
 
 class EventPublisher:
+    __slots__ = ('sender', 'instance', 'signal', 'kwargs')
+
     action = 'update'
 
     def __init_subclass__(
@@ -58,6 +104,11 @@ class EventPublisher:
         cls.type = type
         cls.is_changed_included = is_changed_included
         cls.is_tenant_bound = hasattr(cls.orm_model, 'tenant_id')
+        # Built on the first get_body, when forward refs of the event schema are resolved
+        cls._extract_data = None
+        cls._extract_data_built = False
+        # With the default get_keys the routing key only varies by action and tenant
+        cls._routing_key_prefix = f'{cls.version}.{cls.type}.' if cls.get_keys is EventPublisher.get_keys else None
         cls.logger = logging.getLogger(f'{cls.__module__}.{cls.__name__}')
 
         cls.register()
@@ -93,6 +144,12 @@ class EventPublisher:
 
     @property
     def routing_key(self):
+        if self._routing_key_prefix is not None:
+            if self.is_tenant_bound:
+                return self._routing_key_prefix + self.action + '.' + self.instance.tenant_id
+
+            return self._routing_key_prefix + self.action
+
         keys = self.get_keys()
 
         if self.is_tenant_bound:
@@ -106,8 +163,21 @@ class EventPublisher:
     def get_data_op(self) -> DataChangeEvent.DataOperation:
         return DataChangeEvent.DataOperation.UPDATE
 
+    @classmethod
+    def _build_extract_data(cls):
+        extract_data = _get_scalar_extractor(cls.event_schema)
+        cls._extract_data = staticmethod(extract_data) if extract_data else None
+        cls._extract_data_built = True
+
     def get_body(self) -> DataChangeEvent:
-        data = transfer_from_orm(self.event_schema, self.instance).dict(by_alias=True)
+        if not self._extract_data_built:
+            self._build_extract_data()
+
+        if self._extract_data:
+            data = self._extract_data(self.instance)
+
+        else:
+            data = transfer_from_orm(self.event_schema, self.instance).dict(by_alias=True)
 
         if self.is_changed_included:
             modified = self.instance.get_dirty_fields(check_relationship=True)
@@ -117,7 +187,8 @@ class EventPublisher:
                 } for field, _value in modified.items()
             ]
 
-        return DataChangeEvent(
+        # All values are built here with their declared types, so validation is skipped
+        return DataChangeEvent.construct(
             data=data,
             data_type=self.data_type,
             data_op=self.get_data_op(),
@@ -125,6 +196,33 @@ class EventPublisher:
             metadata=self.get_metadata(),
         )
 
+    def get_producer(self) -> Producer:
+        try:
+            producers = _local.producers
+
+        except AttributeError:
+            producers = _local.producers = {}
+
+        key = (id(self.connection), id(self.exchange))
+        try:
+            return producers[key]
+
+        except KeyError:
+            # Declare the exchange once here instead of checking it on every publish
+            producer = self.connection.Producer(exchange=self.exchange, auto_declare=False)
+            producer.maybe_declare(self.exchange, retry=True, **self.get_retry_policy())
+            producers[key] = producer
+            return producer
+
+    def dump_body(self, body: DataChangeEvent):
+        if not orjson:
+            return body.json()
+
+        # Only the envelope needs pydantic, `data` is left to orjson instead of being copied by .dict() first
+        content = body.dict(exclude={'data'})
+        content['data'] = body.data
+        return orjson.dumps(content, default=pydantic_encoder, option=orjson.OPT_NON_STR_KEYS)
+
     def get_retry_policy(self):
         return {
             'max_retries': 3,
@@ -133,41 +231,50 @@ class EventPublisher:
     @capture_exception
     def process(self):
         span = span_ctx.get()
-        span.set_tag('exchange', self.exchange)
-        span.set_tag('routing_key', self.routing_key)
-        span.set_tag('sender', self.sender)
-        span.set_tag('signal', self.signal)
-        span.set_tag('orm_model', self.orm_model)
+        # Unsampled spans are never sent, so their tags (the routing key in particular) are not worth building
+        if span.sampled:
+            span.set_tag('exchange', self.exchange)
+            span.set_tag('routing_key', self.routing_key)
+            span.set_tag('sender', self.sender)
+            span.set_tag('signal', self.signal)
+            span.set_tag('orm_model', self.orm_model)
 
         self.logger.debug("Publish DataChangeEvent for %s with schema %s on %r", self.orm_model, self.event_schema, self.exchange)
-        self.connection.Producer(exchange=self.exchange).publish(
+        self.get_producer().publish(
             retry=True,
             retry_policy=self.get_retry_policy(),
-            body=self.get_body().json(),
+            body=self.dump_body(self.get_body()),
             content_type='application/json',
+            content_encoding='utf-8',
             routing_key=self.routing_key,
         )
 
 
 class DataChangePublisher(with_typehint(EventPublisher)):
-    @property
-    def action(self):
-        if self.signal == post_save:
-            return 'create' if self.kwargs.get('created') else 'update'
+    def __init__(self, sender, instance: TDjangoModel, signal: Signal, **kwargs):
+        super().__init__(sender, instance, signal, **kwargs)
+        # Resolved once, it is needed for both the routing key and the data operation
+        if signal == post_save:
+            self.action = 'create' if kwargs.get('created') else 'update'
 
-        elif self.signal == post_delete:
-            return 'delete'
+        elif signal == post_delete:
+            self.action = 'delete'
+
+        else:
+            self.action = None
 
     def get_data_op(self) -> DataChangeEvent.DataOperation:
-        return getattr(DataChangeEvent.DataOperation, self.action.upper())
+        return DataChangeEvent.DataOperation[self.action.upper()]
 
     @classmethod
     def register(cls):
-        cls._handle_post_save = partial(cls.handle, signal=post_save)
-        receiver(post_save, sender=cls.orm_model)(cls._handle_post_save)
+        def _handle_signal(sender, **kwargs):
+            # The dispatcher passes the sending signal as keyword argument
+            return cls.handle(sender, **kwargs)
 
-        cls._handle_post_delete = partial(cls.handle, signal=post_delete)
-        receiver(post_delete, sender=cls.orm_model)(cls._handle_post_delete)
+        # Keep strong references, the dispatcher only holds weak ones
+        cls._handle_post_save = cls._handle_post_delete = _handle_signal
+        receiver([post_save, post_delete], sender=cls.orm_model)(_handle_signal)
 
         cls.logger.debug("Registered post_save + post_delete handlers for %s", cls.orm_model)
 
@@ -179,7 +286,10 @@ class StatusChangePublisher(with_typehint(EventPublisher)):
 
     @classmethod
     def register(cls):
-        cls._handle_status_change = partial(cls.handle, signal=cls.orm_model.STATUS_CHANGE)
+        def _handle_status_change(sender, signal=cls.orm_model.STATUS_CHANGE, **kwargs):
+            return cls.handle(sender, signal=signal, **kwargs)
+
+        cls._handle_status_change = _handle_status_change
         receiver(cls.orm_model.STATUS_CHANGE, sender=cls.orm_model)(cls._handle_status_change)
 
         cls.logger.debug("Registered status_change handlers for %s", cls.orm_model)
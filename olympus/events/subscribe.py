@@ -5,11 +5,17 @@ from typing import Any, Type, TypeVar, Union, Iterable, Optional, Dict
 from event_consumer.handlers import DEFAULT_EXCHANGE
 from pydantic import BaseModel
 from django.db import models
-from ..handlers.event_consumer import message_handler
+from ..handlers.event_consumer import message_handler, parsed_body
 from ..utils.pydantic_django import transfer_to_orm, TransferAction
 from ..utils.sentry import instrument_span, span as span_ctx
 from ..security.jwt import access as access_ctx
-from ..schemas import DataChangeEvent, Access, AccessToken
+from ..schemas import DataChangeEvent, EventMetadata, Access, AccessToken
+try:
+    import orjson
+
+except ImportError:
+    orjson = None
+
 try:
     from sentry_sdk import set_extra
 
@@ -27,7 +33,7 @@ class Break(Exception):
 
 
 class EventSubscription:
-    __orm_obj: Optional[TDjangoModel] = None
+    __slots__ = ('body', 'event', 'is_new_orm_obj', 'span', 'data', '__orm_obj')
 
     def __init_subclass__(
         cls,
@@ -39,6 +45,7 @@ class EventSubscription:
         queue_arguments: Optional[Dict[str, object]] = None,
         delete_on_status: Optional[Any] = None,
         create_only_on_op_create: bool = False,
+        trusted: bool = False,
         **kwargs,
     ):
         super().__init_subclass__(**kwargs)
@@ -50,6 +57,7 @@ class EventSubscription:
         cls.queue_arguments = queue_arguments
         cls.delete_on_status = delete_on_status
         cls.create_only_on_op_create = create_only_on_op_create
+        cls.trusted = trusted
         cls.logger = logging.getLogger(f'{cls.__module__}.{cls.__qualname__}')
 
         message_handler(
@@ -60,7 +68,8 @@ class EventSubscription:
             transaction_name=f'{cls.__module__}.{cls.__qualname__}',
         )(cls.handle)
 
-        if not hasattr(cls.orm_model, 'updated_at'):
+        cls.has_updated_at = hasattr(cls.orm_model, 'updated_at')
+        if not cls.has_updated_at:
             warnings.warn("%s has no field 'updated_at'" % cls.orm_model)
 
         cls.is_tenant_bound = hasattr(cls.orm_model, 'tenant_id')
@@ -84,8 +93,17 @@ class EventSubscription:
         instance.process()
 
     def __init__(self, body):
+        self.__orm_obj: Optional[TDjangoModel] = None
         self.body = body
-        self.event = DataChangeEvent.parse_raw(self.body) if isinstance(self.body, (bytes, str)) else DataChangeEvent.parse_obj(self.body)
+        if isinstance(self.body, (bytes, str)):
+            raw, parsed = parsed_body.get()
+            if raw is not self.body:
+                parsed = orjson.loads(self.body) if orjson else json.loads(self.body)
+
+        else:
+            parsed = self.body
+
+        self.event = self.parse_event(parsed)
 
         if self.event.metadata.user and self.event.metadata.user.uid:
             access_ctx.set(Access(
@@ -112,6 +130,19 @@ class EventSubscription:
         self.span.set_data('body', self.body)
         set_extra('body', self.body)
 
+    def parse_event(self, data: dict) -> DataChangeEvent:
+        if not self.trusted:
+            return DataChangeEvent.parse_obj(data)
+
+        # Events from trusted publishers are not validated again, only the fields used for processing are converted
+        return DataChangeEvent.construct(
+            data=data.get('data'),
+            data_type=data.get('data_type'),
+            data_op=DataChangeEvent.DataOperation(data['data_op']),
+            tenant_id=data.get('tenant_id'),
+            metadata=EventMetadata.parse_obj(data.get('metadata') or {}),
+        )
+
     def process(self):
         if self.event.data_op == DataChangeEvent.DataOperation.DELETE:
             self.op_delete()
@@ -122,8 +153,7 @@ class EventSubscription:
     @property
     def orm_obj(self) -> TDjangoModel:
         if not self.__orm_obj:
-            data = json.loads(self.body) if isinstance(self.body, (bytes, str)) else self.body
-            query = models.Q(id=data.get('id'))
+            query = models.Q(id=self.event.data.get('id'))
             if self.is_tenant_bound:
                 query &= models.Q(tenant_id=self.event.tenant_id)
 
@@ -166,13 +196,10 @@ class EventSubscription:
     def op_create_or_update(self):
         self.data: TBaseModel = self.event_schema.parse_obj(self.event.data)
         try:
-            try:
-                if self.orm_obj.updated_at > self.event.metadata.occurred_at:
-                    self.logger.warning("Received data older than last record update. Discarding change!", stack_info=True)
-                    return
-
-            except AttributeError:
-                pass
+            orm_obj = self.orm_obj
+            if self.has_updated_at and orm_obj.updated_at > self.event.metadata.occurred_at:
+                self.logger.warning("Received data older than last record update. Discarding change!", stack_info=True)
+                return
 
         except self.orm_model.DoesNotExist:
             if self.create_only_on_op_create and self.event.data_op != DataChangeEvent.DataOperation.CREATE:
@@ -187,12 +214,9 @@ class EventSubscription:
         except Break:
             return
 
-        try:
+        if self.has_updated_at:
             self.orm_obj.updated_at = self.event.metadata.occurred_at
 
-        except AttributeError:
-            pass
-
         transfer_to_orm(self.data, self.orm_obj, action=TransferAction.SYNC)
 
         self.after_transfer()
@@ -1,10 +1,9 @@
 import logging
 from typing import Any
-from psycopg2.errorcodes import lookup as psycopg2_error_lookup
 from jose.exceptions import JOSEError, ExpiredSignatureError
 from fastapi import Request
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from starlette.exceptions import HTTPException
 from django.core.exceptions import ObjectDoesNotExist
 from django.db.utils import IntegrityError, OperationalError, InternalError
@@ -17,11 +16,22 @@ try:
 except ImportError:
     sentry_sdk = None
 
+try:
+    import orjson
+
+except ImportError:
+    orjson = None
+
 from .. import schemas
 
 
 _logger = logging.getLogger(__name__)
 
+# Same mapping as psycopg2.errorcodes.lookup, already lowercased for use in error codes; built on first use
+_PGCODE_NAMES = None
+
+_INTERNAL_SERVER_ERROR = schemas.Error(type='InternalServerError')
+
 
 def capture_exception(exc):
     _logger.exception(exc)
@@ -31,15 +41,56 @@ def capture_exception(exc):
     return sentry_sdk.capture_exception(exc)
 
 
+def _encode_content(content: Any):
+    if isinstance(content, schemas.Error):
+        # All fields of Error except `detail` are plain strings, so only `detail` needs the generic encoder
+        data = content.dict(by_alias=True)
+        if data['detail'] is not None:
+            data['detail'] = jsonable_encoder(data['detail'])
+
+        return data
+
+    return jsonable_encoder(content)
+
+
+def _get_pgcode_name(pgcode: str) -> str:
+    global _PGCODE_NAMES
+    if _PGCODE_NAMES is None:
+        from psycopg2 import errorcodes as psycopg2_error_codes
+
+        _PGCODE_NAMES = {
+            value: key.rstrip('_').lower()
+            for key, value in vars(psycopg2_error_codes).items()
+            if isinstance(value, str) and len(value) in (2, 5)
+        }
+
+    return _PGCODE_NAMES.get(pgcode, 'unknown')
+
+
 async def respond_details(request: Request, content: Any, status_code: int = 500, headers: dict = None):
-    response = {
-        'detail': jsonable_encoder(content),
-    }
+    if orjson:
+        # Serialize in a single pass, only values orjson does not support natively go through jsonable_encoder
+        response = {
+            'detail': content.dict(by_alias=True) if isinstance(content, schemas.Error) else content,
+        }
+
+    else:
+        response = {
+            'detail': _encode_content(content),
+        }
 
     event_id = sentry_sdk.last_event_id() or request.scope.get('sentry_event_id')
     if event_id:
         response['event_id'] = event_id
 
+    if orjson:
+        return Response(
+            content=orjson.dumps(response, default=jsonable_encoder, option=orjson.OPT_NON_STR_KEYS),
+            status_code=status_code,
+            headers=headers,
+            media_type='application/json',
+        )
+
     return JSONResponse(
         content=response,
         status_code=status_code,
@@ -87,7 +138,7 @@ async def integrity_error_handler(request: Request, exc: IntegrityError):
         code = None
 
     elif exc.__cause__:
-        code = psycopg2_error_lookup(exc.__cause__.pgcode).lower()
+        code = _get_pgcode_name(exc.__cause__.pgcode)
         try:
             if exc.__cause__.diag.constraint_name:
                 code += ":" + exc.__cause__.diag.constraint_name
@@ -124,9 +175,9 @@ async def jose_error_handler(request: Request, exc: JOSEError):
 
 async def generic_exception_handler(request: Request, exc: Exception):
     if isinstance(exc, NotImplementedError):
-        return await respond_details(request, schemas.Error(type='InternalServerError'), status_code=501)
+        return await respond_details(request, _INTERNAL_SERVER_ERROR, status_code=501)
 
     if isinstance(exc, (InternalError, OperationalError)):
         return await respond_details(request, schemas.Error(type=exc.__class__.__name__), status_code=503)
 
-    return await respond_details(request, schemas.Error(type='InternalServerError'))
+    return await respond_details(request, _INTERNAL_SERVER_ERROR)
@@ -1,6 +1,7 @@
-from typing import Iterable, Union, Optional, Dict
+from typing import Any, Iterable, Tuple, Union, Optional, Dict
 import logging
 import json
+from contextvars import ContextVar
 from functools import wraps
 from event_consumer import message_handler as base_message_handler
 from event_consumer.handlers import DEFAULT_EXCHANGE
@@ -8,23 +9,35 @@ from sentry_sdk.integrations.serverless import serverless_function
 from sentry_sdk import start_transaction, last_event_id, Hub
 from sentry_sdk.tracing import Transaction
 
+try:
+    import orjson
+
+except ImportError:
+    orjson = None
+
 
 _logger = logging.getLogger(__name__)
 
+# (raw body, decoded body) of the message currently handled, so handlers do not have to decode it again
+parsed_body: ContextVar[Tuple[Any, Any]] = ContextVar('parsed_body', default=(None, None))
+
 
 def transaction_captured_function(func, transaction_name: Optional[str] = None):
     @wraps(func)
     def wrapper(*args, **kwargs):
-        flow_id = data = None
+        flow_id = data = token = None
 
         try:
             if isinstance(args[0], (str, bytes)):
                 try:
-                    data = json.loads(args[0])
+                    data = orjson.loads(args[0]) if orjson else json.loads(args[0])
 
                 except json.JSONDecodeError:
                     pass
 
+                else:
+                    token = parsed_body.set((args[0], data))
+
             elif isinstance(args[0], dict):
                 data = args[0]
 
@@ -39,8 +52,13 @@ def transaction_captured_function(func, transaction_name: Optional[str] = None):
             op='message_handler',
             name=transaction_name or f'{func.__module__}.{func.__name__}',
         )
-        with Hub.current.start_transaction(transaction):
-            result = func(*args, **kwargs)
+        try:
+            with Hub.current.start_transaction(transaction):
+                result = func(*args, **kwargs)
+
+        finally:
+            if token is not None:
+                parsed_body.reset(token)
 
         _logger.debug("Logged message handling with trace_id=%s, span_id=%s, id=%s", transaction.trace_id, transaction.span_id, last_event_id())
         return result
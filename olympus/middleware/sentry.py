@@ -12,13 +12,15 @@ class SentryAsgiMiddleware(BaseSentryAsgiMiddleware):
 
     async def _run_asgi3(self, scope, receive, send):
         async def _send(message: Message):
-            try:
-                message.get('headers', list()).append(
-                    (b'X-Flow-ID', Hub.current.scope.transaction.to_traceparent())
-                )
+            if message['type'] == 'http.response.start':
+                try:
+                    flow_id = Hub.current.scope.transaction.to_traceparent()
 
-            except AttributeError:
-                pass
+                except AttributeError:
+                    pass
+
+                else:
+                    message.setdefault('headers', []).append((b'X-Flow-ID', flow_id.encode()))
 
             await send(message)
 
@@ -1,37 +1,77 @@
-from typing import Optional, Callable
+from contextvars import ContextVar
+from typing import Iterable, Optional, Callable
 from django.db import models
 from django.db.models import Func, Value, CharField, JSONField
+from django.db.models.signals import class_prepared
+from django.dispatch import receiver
 from django.db.transaction import atomic
 from .schemas import Access
 from .exceptions import AccessError
 
 
+# Set while bulk_save runs, ModelAtomicSave.save then relies on its transaction instead of opening a savepoint
+_in_bulk_save: ContextVar[bool] = ContextVar('in_bulk_save', default=False)
+
+
 class ModelAtomicSave(models.Model):
-    @atomic
     def save(self, *args, **kwargs):
-        return super().save(*args, **kwargs)
+        if _in_bulk_save.get():
+            return super().save(*args, **kwargs)
+
+        with atomic():
+            return super().save(*args, **kwargs)
+
+    @classmethod
+    def bulk_save(cls, instances: Iterable['ModelAtomicSave'], *args, **kwargs):
+        """
+        Saves all instances in a single transaction instead of one transaction per instance.
+
+        Overrides of save are called as usual, only the savepoint per instance is left out.
+        """
+        token = _in_bulk_save.set(True)
+        try:
+            with atomic():
+                for instance in instances:
+                    instance.save(*args, **kwargs)
+
+        finally:
+            _in_bulk_save.reset(token)
 
     class Meta:
         abstract = True
 
 
 class AccessMixin(models.Model):
+    # Set per model once its fields are contributed, see _set_has_tenant_id
+    _has_tenant_id = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # selector -> name of the `_check_access_<selector>` method
+        cls._access_selector_checks = {
+            name[len('_check_access_'):]: name
+            for name in dir(cls)
+            if name.startswith('_check_access_')
+        }
+
     def check_access(self, access: Access, selector: Optional[str] = None, action: Optional[str] = None):
-        try:
-            if access.tenant_id != self.tenant_id:
-                raise AccessError
+        # Models without tenant_id are not tenant-specific
+        if self._has_tenant_id:
+            try:
+                if access.tenant_id != self.tenant_id:
+                    raise AccessError
 
-        except AttributeError:
-            # Model is not tenant-specific
-            pass
+            except AttributeError:
+                # A tenant_id property raising AttributeError also means that the model is not tenant-specific
+                pass
 
         if not selector:
             selector = access.scope.selector
 
         try:
-            selector_check: Callable = getattr(self, f'_check_access_{selector}')
+            selector_check: Callable = getattr(self, self._access_selector_checks[selector])
 
-        except AttributeError as error:
+        except KeyError as error:
             raise AccessError from error
 
         selector_check(access=access, action=action)
@@ -40,6 +80,12 @@ class AccessMixin(models.Model):
         abstract = True
 
 
+@receiver(class_prepared)
+def _set_has_tenant_id(sender, **kwargs):
+    if issubclass(sender, AccessMixin):
+        sender._has_tenant_id = hasattr(sender, 'tenant_id')
+
+
 class JSONArrayElements(Func):
     function = 'jsonb_array_elements'
     arity = 1
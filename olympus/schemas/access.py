@@ -1,6 +1,6 @@
-from typing import Any, Optional, List, Set, Type
-from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from typing import Any, Dict, FrozenSet, Optional, List, Set, Tuple, Type
+from datetime import datetime, timezone
+from pydantic import BaseModel, Field, PrivateAttr, validator
 
 
 class AccessScopes(set):
@@ -35,15 +35,56 @@ class AccessToken(BaseModel):
     jti: str = Field(title='JWT ID')
     crt: bool = Field(False, title='Critical')
 
+    _aud_set: Optional[FrozenSet[str]] = PrivateAttr(None)
+    _aud_set_source: Optional[Tuple[str, ...]] = PrivateAttr(None)
+    _aud_matches: Optional[Dict[Tuple[str, ...], Optional[str]]] = PrivateAttr(None)
+
+    @classmethod
+    def from_verified_claims(cls, claims: dict) -> 'AccessToken':
+        """
+        Creates the token from claims already verified by jose without running validation, only timestamps are converted.
+        """
+        values = {name: claims[name] for name in cls.__fields__ if name in claims}
+        for name in ('iat', 'nbf', 'exp'):
+            if isinstance(values.get(name), (int, float)):
+                values[name] = datetime.fromtimestamp(values[name], tz=timezone.utc)
+
+        return cls.construct(**values)
+
+    @property
+    def aud_set(self) -> FrozenSet[str]:
+        """
+        The audiences as frozenset for membership tests, rebuilt when `aud` is reassigned or changed in place.
+        """
+        # Compared by a copy, the list itself may have been changed since the set was built
+        aud = tuple(self.aud)
+        if self._aud_set_source != aud:
+            self._aud_set = frozenset(aud)
+            self._aud_set_source = aud
+            self._aud_matches = {}
+
+        return self._aud_set
+
     def has_audience(self, audiences: List[str]) -> Optional[str]:
+        aud_set = self.aud_set
+        if isinstance(audiences, tuple):
+            # Tuples are the precomputed scopes of field plans, checked for every transferred object
+            try:
+                return self._aud_matches[audiences]
+
+            except KeyError:
+                match = self._aud_matches[audiences] = self.has_audience(list(audiences))
+                return match
+
         for audience in audiences:
-            if audience in self.aud:
+            if audience in aud_set:
                 return audience
 
         return
 
     def has_audiences(self, audiences: List[str]) -> List[str]:
-        return [audience for audience in audiences if audience in self.aud]
+        aud_set = self.aud_set
+        return [audience for audience in audiences if audience in aud_set]
 
     def get_scopes(self):
         audiences = [AccessScope.from_str(audience) for audience in self.aud]
@@ -51,10 +92,10 @@ class AccessToken(BaseModel):
 
     def __contains__(self, item):
         if isinstance(item, AccessScope):
-            return str(item) in self.aud
+            return str(item) in self.aud_set
 
         if isinstance(item, str):
-            return item in self.aud
+            return item in self.aud_set
 
         raise NotImplementedError
 
@@ -1,5 +1,5 @@
 from enum import Enum
-import secrets
+import os
 from datetime import datetime
 from django.utils import timezone
 from typing import Any, List, Optional
@@ -14,12 +14,20 @@ from ..security.jwt import access as access_ctx
 
 
 def default_eid():
-    return secrets.token_hex(32)
+    # Same as secrets.token_hex(32), 64 hex chars as required by EventMetadata.eid
+    return os.urandom(32).hex()
 
 
 def _get_flow_id():
+    if not sentry_sdk:
+        return None
+
     try:
-        return sentry_sdk.Hub.current.scope.transaction.to_traceparent()
+        transaction = sentry_sdk.Hub.current.scope.transaction
+        if transaction is None:
+            return None
+
+        return transaction.to_traceparent()
 
     except (KeyError, AttributeError, IndexError, TypeError):
         return None
@@ -48,10 +56,16 @@ def _get_roles() -> list:
 
 
 def _get_user():
-    if not _get_uid():
+    access = access_ctx.get(None)
+    if not access or not access.user_id:
         return
 
-    return EventMetadata.User()
+    # Same values the User field factories would read, without looking up the access context for each of them
+    return EventMetadata.User.construct(
+        uid=access.user_id,
+        scopes=access.token.aud,
+        roles=access.token.rls,
+    )
 
 
 class EventMetadata(BaseModel):
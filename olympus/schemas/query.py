@@ -1,7 +1,7 @@
-from typing import List, Union
+from typing import List, Optional, Union
 from pydantic import BaseModel
 from pydantic.error_wrappers import ErrorWrapper
-from django.db.models import Q, QuerySet
+from django.db.models import Q, QuerySet, Prefetch
 from django.db.models.manager import BaseManager
 from django.core.exceptions import FieldDoesNotExist, FieldError
 from fastapi.exceptions import RequestValidationError
@@ -12,12 +12,28 @@ class Pagination(BaseModel):
     offset: int
     order_by: List[str]
 
-    def query(self, objects: Union[BaseManager, QuerySet], q_filters: Q = Q()) -> QuerySet:
+    def query(
+        self,
+        objects: Union[BaseManager, QuerySet],
+        q_filters: Q = Q(),
+        select_related: Optional[List[str]] = None,
+        prefetch_related: Optional[List[Union[str, Prefetch]]] = None,
+    ) -> QuerySet:
         """
         Filter a given model's BaseManager or pre-filtered Queryset with the given q_filters and apply order_by and offset/limit from the pagination.
+        Relations given in select_related / prefetch_related are loaded together with the page instead of once per object.
+
+        Note: `limit` is the end index of the slice, see `depends_pagination`.
         """
         try:
-            return objects.filter(q_filters).order_by(*self.order_by)[self.offset:self.limit]
+            query = objects.filter(q_filters)
+            if select_related:
+                query = query.select_related(*select_related)
+
+            if prefetch_related:
+                query = query.prefetch_related(*prefetch_related)
+
+            return query.order_by(*self.order_by)[self.offset:self.limit]
 
         except (FieldDoesNotExist, FieldError) as error:
             raise RequestValidationError([
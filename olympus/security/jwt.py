@@ -1,3 +1,7 @@
+import hashlib
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Optional, Tuple
 from contextvars import ContextVar
 from jose import jwt
@@ -22,13 +26,41 @@ except ImportError:
 access: ContextVar[Access] = ContextVar('access')
 
 
+@lru_cache(maxsize=1024)
+def _parse_audiences(audiences: Tuple[str, ...]) -> Tuple[dict, ...]:
+    return tuple(AccessScope.from_str(audience).dict() for audience in audiences)
+
+
+def _parse_scopes(audiences: Tuple[str, ...]) -> List[AccessScope]:
+    """
+    Returns new AccessScopes on every call, only their validated values are cached and shared between requests
+    """
+    return [AccessScope.construct(**values) for values in _parse_audiences(audiences)]
+
+
 class JWTToken(APIKeyHeader):
     def __init__(
         self, *, name: str = 'Authorization', scheme_name: Optional[str] = None, auto_error: bool = True, key: str, algorithm: str, issuer: Optional[str] = None,
+        claims_cache_size: int = 1024, trust_claims: bool = False,
     ):
         self.key = key
         self.algorithms = [algorithm]
         self.issuer = issuer
+        self.claims_cache_size = claims_cache_size
+        # Skip pydantic validation of the AccessToken, the claims are verified by jose already
+        self.trust_claims = trust_claims
+        # Claims required by AccessToken are enforced by jose already
+        self._decode_options = {
+            'verify_aud': False,
+            'require_iat': True,
+            'require_nbf': True,
+            'require_exp': True,
+            'require_iss': True,
+            'require_sub': True,
+            'require_jti': True,
+        }
+        self._decode_options_with_audience = {**self._decode_options, 'verify_aud': True}
+        self._claims_cache: 'OrderedDict[bytes, dict]' = OrderedDict()
 
         super().__init__(name=name, scheme_name=scheme_name, auto_error=auto_error)
 
@@ -39,11 +71,33 @@ class JWTToken(APIKeyHeader):
             algorithms=self.algorithms,
             issuer=self.issuer,
             audience=audience,
-            options={
-                'verify_aud': bool(audience),
-            },
+            options=self._decode_options_with_audience if audience else self._decode_options,
         )
 
+    def get_claims(self, token: str) -> dict:
+        """
+        Returns the decoded claims of the token. Verified tokens are cached (LRU) by their digest until they expire.
+        """
+        if not self.claims_cache_size:
+            return self.decode_token(token)
+
+        cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        claims = self._claims_cache.get(cache_key)
+        if claims is not None:
+            if claims['exp'] > time.time():
+                self._claims_cache.move_to_end(cache_key)
+                return claims
+
+            del self._claims_cache[cache_key]
+
+        claims = self.decode_token(token)
+        if 'exp' in claims:
+            self._claims_cache[cache_key] = claims
+            if len(self._claims_cache) > self.claims_cache_size:
+                self._claims_cache.popitem(last=False)
+
+        return claims
+
     async def __call__(self, request: Request, scopes: SecurityScopes = None) -> Optional[Access]:
         try:
             token = await super().__call__(request)
@@ -57,8 +111,9 @@ class JWTToken(APIKeyHeader):
         if not token:
             return
 
+        claims = self.get_claims(token)
         current_access = Access(
-            token=AccessToken(**self.decode_token(token)),
+            token=AccessToken.from_verified_claims(claims) if self.trust_claims else AccessToken(**claims),
         )
         set_extra('access.token.aud', current_access.token.aud)
 
@@ -77,7 +132,7 @@ class JWTToken(APIKeyHeader):
                     detail=scopes.scopes,
                 ))
 
-            aud_scopes = [AccessScope.from_str(audience) for audience in audiences]
+            aud_scopes = _parse_scopes(tuple(audiences))
             current_access.scopes = aud_scopes
             current_access.scope = aud_scopes[0]
             set_extra('access.scopes', aud_scopes)
@@ -4,5 +4,5 @@ from . import asyncio, dict, django, fastapi, pydantic_django, fastapi_django, p
 from .dict import remove_none as dict_remove_none
 from .django import AllowAsyncUnsafe as DjangoAllowAsyncUnsafe
 from .fastapi import depends_pagination
-from .pydantic_django import transfer_from_orm, transfer_to_orm, check_field_access, update_orm, validate_object, DjangoORMBaseModel
+from .pydantic_django import transfer_from_orm, transfer_to_orm, transfer_to_orm_async, check_field_access, update_orm, validate_object, DjangoORMBaseModel
 from .fastapi_django import aggregation
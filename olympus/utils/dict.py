@@ -2,12 +2,30 @@ from typing import List
 
 
 def remove_none(d):
-    if isinstance(d, dict):
-        return {key: remove_none(value) for key, value in d.items() if value is not None}
-
-    else:
+    """
+    Returns a copy of d and all nested dicts without the keys which have None values.
+    """
+    if not isinstance(d, dict):
         return d
 
+    cleaned = {}
+    # Pairs of a source dict and the new dict its values are copied into, nested dicts are handled after their parent
+    stack = [(d, cleaned)]
+    while stack:
+        source, target = stack.pop()
+        for key, value in source.items():
+            if value is None:
+                continue
+
+            if isinstance(value, dict):
+                target[key] = {}
+                stack.append((value, target[key]))
+
+            else:
+                target[key] = value
+
+    return cleaned
+
 
 def key_in_dict(keys: List[str], d: dict) -> bool:
     for key in keys:
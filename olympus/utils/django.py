@@ -1,11 +1,11 @@
 import os
 import logging
 from contextvars import ContextVar, copy_context
-from asyncio import Future
+from asyncio import get_event_loop
 from inspect import CO_COROUTINE
 from functools import wraps
 from typing import Callable, Optional
-from django.db import transaction
+from django.db import connections, DEFAULT_DB_ALIAS
 from .asyncio import is_async
 
 
@@ -31,6 +31,8 @@ class AllowAsyncUnsafe:
 
 
 def on_transaction_complete(awaitable: bool = False, callback: Optional[Callable] = None, error_callback: Optional[Callable] = None, deduplicate: Optional[Callable] = None):
+    has_dedup = deduplicate is not None
+
     def wrapper(callable):
         @wraps(callable)
         def wrapped(*args, **kwargs):
@@ -41,20 +43,17 @@ def on_transaction_complete(awaitable: bool = False, callback: Optional[Callable
             elif awaitable and not is_async_:
                 raise AssertionError("Cannot call awaitable from sync context")
 
-            try:
-                pending = pending_transaction_complete_operations.get()
-
-            except LookupError:
-                pending = PENDING_TRANSACTION_COMPLETE_OPERATIONS
+            pending = pending_transaction_complete_operations.get(PENDING_TRANSACTION_COMPLETE_OPERATIONS)
 
-            if deduplicate:
+            if has_dedup:
                 dedup_id = deduplicate(*args, **kwargs)
                 pending[dedup_id] = callable
 
-            future = Future() if awaitable else None
+            # Let the running loop create the future, so loop implementations like uvloop can use their own
+            future = get_event_loop().create_future() if awaitable else None
             def call():
-                if deduplicate:
-                    if pending.get(dedup_id) != callable:
+                if has_dedup:
+                    if pending.get(dedup_id) is not callable:
                         _logger.info("Deduplicated call with dedup_id %r to %s", dedup_id, callable)
                         if awaitable:
                             future.set_result(None)
@@ -91,11 +90,13 @@ def on_transaction_complete(awaitable: bool = False, callback: Optional[Callable
 
             context = copy_context()
 
-            if not transaction.get_connection().in_atomic_block:
+            # Same connection transaction.get_connection() / transaction.on_commit() would use, looked up once
+            connection = connections[DEFAULT_DB_ALIAS]
+            if not connection.in_atomic_block:
                 context.run(call)
 
             else:
-                transaction.on_commit(lambda: context.run(call))
+                connection.on_commit(lambda: context.run(call))
 
             return future
 
@@ -2,11 +2,15 @@ from decimal import Decimal
 from typing import Optional
 
 
+_ONE = Decimal(1)
+_HUNDRED = Decimal(100)
+
+
 def calculate_gross_net(product_price: Decimal, price_selling_type: str, tax_percentage: Optional[Decimal] = None, price_includes_tax: Optional[bool] = None):
-    tax_rate = Decimal(1)
+    tax_rate = _ONE
 
     if tax_percentage:
-        tax_rate = Decimal(1) + (tax_percentage / 100)
+        tax_rate = _ONE + (tax_percentage / _HUNDRED)
 
     if (price_selling_type == 'B2C' and price_includes_tax in [None, True]) \
         or (price_selling_type == 'B2B' and price_includes_tax is True):
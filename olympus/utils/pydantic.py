@@ -1,11 +1,26 @@
 import typing
-from typing import Callable, ForwardRef, Optional, Type, Any
+from typing import Callable, Dict, ForwardRef, FrozenSet, List, Optional, Sequence, Set, Tuple, Type, Any
+from weakref import WeakValueDictionary
 from pydantic import BaseModel, create_model, Field
 from pydantic.fields import ModelField, FieldInfo, SHAPE_SINGLETON, SHAPE_LIST, Undefined
 
 
 TypingGenericAlias = type(Any)
 
+# Generic aliases by their `_name`, to rebuild an outer type around a recreated model
+_GENERIC_TYPES = {
+    'List': List,
+    'Set': Set,
+    'FrozenSet': FrozenSet,
+    'Sequence': Sequence,
+    'Tuple': Tuple,
+    'Dict': Dict,
+}
+
+# Models created by to_optional / include_reference, so every source model is only recreated once per process and module
+_optional_models = WeakValueDictionary()
+_recreated_models = WeakValueDictionary()
+
 
 def _new_field_from_model_field(
     field: ModelField,
@@ -31,8 +46,19 @@ def to_optional(id_key: str = 'id'):
         def optional_model(c, __module__: str, __parent__module__: str):
             try:
                 if issubclass(c, BaseModel):
+                    model_module = c.__module__ if c.__module__ != __parent__module__ else __module__
+                    # The module of the created model depends on the decorated class, so it is part of the key
+                    cache_key = (c, id_key, model_module)
+                    try:
+                        return _optional_models[cache_key]
+
+                    except KeyError:
+                        pass
+
                     field: ModelField
                     fields = {}
+                    # Models which are already optional throughout are used as they are
+                    changed = False
                     for key, field in c.__fields__.items():
                         field_type = optional_model(field.outer_type_, __module__=__module__, __parent__module__=__parent__module__)
                         default = field.default
@@ -45,14 +71,22 @@ def to_optional(id_key: str = 'id'):
                         elif field.required:
                             default = default or ...
 
+                        if field.required or field_type is not field.outer_type_:
+                            changed = True
+
                         fields[key] = (field_type, _new_field_from_model_field(field, default, required=False))
 
-                    return create_model(
+                    if not changed:
+                        _optional_models[cache_key] = c
+                        return c
+
+                    optional = _optional_models[cache_key] = create_model(
                         c.__qualname__,
                         __base__=c,
-                        __module__=c.__module__ if c.__module__ != __parent__module__ else __module__,
+                        __module__=model_module,
                         **fields,
                     )
+                    return optional
 
             except TypeError:
                 pass
@@ -69,32 +103,45 @@ class Reference(BaseModel):
         super().__init_subclass__(**kwargs)
         cls._rel = rel
         cls._rel_params = rel_params
-        c = cls
-        while cls._rel is None:
-            if issubclass(c.__base__, Reference):
-                c = c.__base__
-                if not c:
-                    raise AssertionError("Cannot find parent Reference with `rel` set")
+        if rel is not None:
+            return
 
-                try:
-                    cls._rel = c._rel
-                    cls._rel_params = c._rel_params
+        for base in cls.__mro__[1:]:
+            if base is Reference:
+                break
 
-                except AttributeError:
-                    pass
+            base_rel = base.__dict__.get('_rel')
+            if base_rel is not None:
+                cls._rel = base_rel
+                cls._rel_params = base.__dict__.get('_rel_params')
+                return
 
-            else:
-                raise AssertionError
+        raise AssertionError("Cannot find parent Reference with `rel` set")
 
 
 def include_reference(reference_key: str = '$rel', reference_params_key: str = '$rel_params'):
-    recreated_models = {}
     def wrapped(cls: Type[BaseModel]):
-        def model_with_rel(c: Type, __parent__: Type, __module__: str, __parent__module__: str):
+        __module__ = cls.__module__
+        __parent__module__ = cls.__base__.__module__
+
+        def model_with_rel(c: Type, __parent__: Type):
+            """
+            Yields the types of the submodels to process first and receives their result, see the loop below
+            """
             if isinstance(c, ForwardRef):
                 return c, False
 
             if issubclass(c, BaseModel):
+                model_module = c.__module__ if c.__module__ != __parent__module__ else __module__
+                # The module of the recreated model depends on the decorated class, so it is part of the key
+                cache_key = (c, reference_key, reference_params_key, model_module)
+                recreated = _recreated_models.get(cache_key)
+                if recreated is not None:
+                    if __parent__:
+                        setattr(__parent__, c.__name__, recreated)
+
+                    return recreated, True
+
                 field: ModelField
                 fields = {}
                 recreate_model = False
@@ -103,9 +150,11 @@ def include_reference(reference_key: str = '$rel', reference_params_key: str = '
                         fields[key] = (field.outer_type_, _new_field_from_model_field(field))
                         continue
 
-                    field_type, recreated_model = model_with_rel(field.type_, c, __module__=__module__, __parent__module__=__parent__module__)
+                    field_type, recreated_model = yield field.type_, c
                     if field.type_ != field.outer_type_:
-                        field_type = getattr(typing, field.outer_type_._name)[field_type]
+                        generic_name = field.outer_type_._name
+                        generic_type = _GENERIC_TYPES.get(generic_name) or getattr(typing, generic_name)
+                        field_type = generic_type[field_type]
 
                     if field.allow_none:
                         field_type = Optional[field_type]
@@ -128,22 +177,37 @@ def include_reference(reference_key: str = '$rel', reference_params_key: str = '
                         fields['x_reference_params_key'] = (dict, Field(alias=reference_params_key, orm_method=c._rel_params))
 
                 if recreate_model:
-                    if c not in recreated_models:
-                        recreated_models[c] = create_model(
-                            f'{c.__qualname__} [R]',
-                            __base__=c,
-                            __module__=c.__module__ if c.__module__ != __parent__module__ else __module__,
-                            **fields,
-                        )
-                        recreated_models[c].__recreated__ = True
+                    recreated = _recreated_models[cache_key] = create_model(
+                        f'{c.__qualname__} [R]',
+                        __base__=c,
+                        __module__=model_module,
+                        **fields,
+                    )
+                    recreated.__recreated__ = True
 
                     if __parent__:
-                        setattr(__parent__, c.__name__, recreated_models[c])
+                        setattr(__parent__, c.__name__, recreated)
 
-                    return recreated_models[c], True
+                    return recreated, True
 
             return c, False
 
-        return model_with_rel(cls, None, __module__=cls.__module__, __parent__module__=cls.__base__.__module__)[0]
+        # Walk the submodels with an explicit stack instead of recursion, each model_with_rel generator is resumed
+        # with the result of the submodel it yielded
+        stack = [model_with_rel(cls, None)]
+        result = None
+        while stack:
+            try:
+                submodel = stack[-1].send(result)
+
+            except StopIteration as stop:
+                stack.pop()
+                result = stop.value
+
+            else:
+                stack.append(model_with_rel(*submodel))
+                result = None
+
+        return result[0]
 
     return wrapped
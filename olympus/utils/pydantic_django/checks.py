@@ -1,7 +1,32 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple, Type
 from pydantic import BaseModel
 from ...schemas import Access, Error
 from ...exceptions import AccessError
+from .plan import _store_on_class
+
+
+def _get_field_checks(model_cls: Type[BaseModel]) -> Dict[str, Tuple[Optional[List[str]], bool]]:
+    """
+    Returns (scopes, is_critical) of all fields of model_cls which restrict access.
+
+    Stored on the class itself like the transfer plans, so it lives as long as the class does.
+    """
+    try:
+        # Not inherited, subclasses have their own fields
+        return model_cls.__dict__['__orm_field_checks__']
+
+    except KeyError:
+        pass
+
+    checks = {}
+    for key, field in model_cls.__fields__.items():
+        scopes = field.field_info.extra.get('scopes')
+        is_critical = bool(field.field_info.extra.get('is_critical'))
+        if scopes or is_critical:
+            checks[key] = (scopes, is_critical)
+
+    _store_on_class(model_cls, '__orm_field_checks__', checks)
+    return checks
 
 
 def check_field_access(input: BaseModel, access: Access):
@@ -18,38 +43,52 @@ def check_field_access(input: BaseModel, access: Access):
         name: str = Field(scopes=['elysium.addresses.update.any',])
     ```
     """
-    def check(model: BaseModel, input: dict, access: Access, loc: Optional[List[str]] = None):
-        if not loc:
-            loc = ['body',]
+    # Depth-first walk with an explicit stack of the models whose fields are still being iterated, in the same order
+    # as a recursive walk would raise the errors
+    stack = [(input, iter(input.__fields__), ['body',])]
+    while stack:
+        model, keys, loc = stack[-1]
+        field_checks = _get_field_checks(model.__class__)
+        fields_set = model.__fields_set__
+        for key in keys:
+            if key not in fields_set:
+                continue
+
+            value = getattr(model, key)
+            if isinstance(value, BaseModel):
+                # Continued with the remaining keys once the submodel is done
+                stack.append((value, iter(value.__fields__), loc + [key]))
+                break
 
-        for key, value in input.items():
             if isinstance(value, dict):
-                try:
-                    check(getattr(model, key), value, access, loc=loc + [key])
-
-                except AttributeError:
-                    pass
-
-            elif key in model.__fields__:
-                scopes = model.__fields__[key].field_info.extra.get('scopes')
-                if scopes:
-                    if not access.token.has_audience(scopes):
-                        raise AccessError(detail=Error(
-                            type='FieldAccessError',
-                            code='access_error.field',
-                            detail={
-                                'loc': loc + [key],
-                            },
-                        ))
-
-                elif model.__fields__[key].field_info.extra.get('is_critical'):
-                    if not access.token.crt:
-                        raise AccessError(detail=Error(
-                            type='FieldAccessError',
-                            code='access_error.field_is_critical',
-                            detail={
-                                'loc': loc + [key],
-                            },
-                        ))
-
-    check(input, input.dict(exclude_unset=True), access)
+                # Plain dicts are not checked, only fields of models
+                continue
+
+            try:
+                scopes, is_critical = field_checks[key]
+
+            except KeyError:
+                continue
+
+            if scopes:
+                if not access.token.has_audience(scopes):
+                    raise AccessError(detail=Error(
+                        type='FieldAccessError',
+                        code='access_error.field',
+                        detail={
+                            'loc': loc + [key],
+                        },
+                    ))
+
+            elif is_critical:
+                if not access.token.crt:
+                    raise AccessError(detail=Error(
+                        type='FieldAccessError',
+                        code='access_error.field_is_critical',
+                        detail={
+                            'loc': loc + [key],
+                        },
+                    ))
+
+        else:
+            stack.pop()
@@ -1,18 +1,21 @@
 import os
 import json
 from typing import Coroutine, Mapping, Optional, Type, Union
-from django.db.models.query_utils import DeferredAttribute
 from pydantic import BaseModel, parse_obj_as
 from pydantic.fields import ModelField, SHAPE_SINGLETON, SHAPE_LIST
 from django.db import models
 from django.db.models.manager import Manager
-from django.db.models.fields.related_descriptors import ManyToManyDescriptor, ReverseManyToOneDescriptor
-from django.utils.functional import cached_property
-from ...schemas import AccessScope
 from ...exceptions import AccessError
 from ...security.jwt import access as access_ctx
 from ..sentry import instrument_span, span as span_ctx
 from ..asyncio import is_async
+from .plan import FieldPlan, ScalarRun, get_read_plan, KIND_JSON, KIND_PROPERTY, KIND_M2M, KIND_REVERSE_M2O, KIND_SCALAR_RUN
+
+try:
+    import orjson
+
+except ImportError:
+    orjson = None
 
 if os.getenv('USE_ASYNCIO'):
     from ..asyncio import sync_to_async
@@ -77,13 +80,13 @@ def transfer_from_orm(
 
 
 def _compute_value_from_orm_method(
-    orm_method: callable,
-    field: ModelField,
+    plan: FieldPlan,
     django_obj: models.Model,
     filter_submodel: Optional[Mapping[Manager, models.Q]] = None,
 ):
-    value = orm_method(django_obj)
-    if value is not None and issubclass(field.type_, BaseModel) and not isinstance(value, BaseModel):
+    field = plan.field
+    value = plan.orm_method(django_obj)
+    if value is not None and plan.is_basemodel and not isinstance(value, BaseModel):
         if field.shape == SHAPE_SINGLETON:
             if isinstance(value, models.Model):
                 value = _transfer_from_orm(
@@ -121,34 +124,33 @@ def _compute_value_from_orm_method(
 
 
 def _transfer_field_list(
-    field: ModelField,
-    orm_field,
+    plan: FieldPlan,
     django_obj: models.Model,
+    pydantic_field_on_parent: Optional[ModelField] = None,
     filter_submodel: Optional[Mapping[Manager, models.Q]] = None,
 ):
+    field = plan.field
+    orm_field = plan.orm_field
     sub_filter = filter_submodel and filter_submodel.get(orm_field) or models.Q()
 
-    if isinstance(orm_field, ManyToManyDescriptor):
-        relatedmanager = getattr(django_obj, orm_field.field.attname)
+    if plan.kind == KIND_M2M:
+        relatedmanager = getattr(django_obj, plan.attname)
         related_objs = relatedmanager.through.objects.filter(models.Q(**{relatedmanager.source_field_name: relatedmanager.instance}) & sub_filter)
 
-    elif isinstance(orm_field, ReverseManyToOneDescriptor):
-        relatedmanager = getattr(django_obj, orm_field.rel.name)
+    elif plan.kind == KIND_REVERSE_M2O:
+        relatedmanager = getattr(django_obj, plan.related_name)
         related_objs = relatedmanager.filter(sub_filter)
 
-    elif isinstance(orm_field, DeferredAttribute) and isinstance(orm_field.field, models.JSONField):
+    else:
         value = None
         try:
-            value = getattr(django_obj, orm_field.field.attname)
+            value = getattr(django_obj, plan.attname)
 
         except AttributeError:
             raise  # attach debugger here ;)
 
         return parse_obj_as(field.outer_type_, value or [])
 
-    else:
-        raise NotImplementedError
-
     return [
         _transfer_from_orm(
             pydantic_cls=field.type_,
@@ -161,40 +163,22 @@ def _transfer_field_list(
 
 
 def _transfer_field_singleton(
-    field: ModelField,
-    orm_field,
+    plan: FieldPlan,
     django_obj: models.Model,
     pydantic_field_on_parent: Optional[ModelField] = None,
     filter_submodel: Optional[Mapping[Manager, models.Q]] = None,
 ):
-    if not orm_field and issubclass(field.type_, BaseModel):
-        return _transfer_from_orm(
-            pydantic_cls=field.type_,
-            django_obj=django_obj,
-            pydantic_field_on_parent=field,
-            filter_submodel=filter_submodel,
-        )
-
+    field = plan.field
     value = None
-    is_property = isinstance(orm_field, (property, cached_property))
-    is_django_field = not is_property
 
     try:
-        if is_property:
-            if isinstance(orm_field, property):
-                value = orm_field.fget(django_obj)
-
-            elif isinstance(orm_field, cached_property):
-                value = orm_field.__get__(django_obj)
-
-            else:
-                raise NotImplementedError
-
+        if plan.kind == KIND_PROPERTY:
+            value = plan.property_getter(django_obj)
             if isinstance(value, models.Model):
                 value = value.pk
 
         else:
-            value = getattr(django_obj, orm_field.field.attname)
+            value = getattr(django_obj, plan.attname)
 
     except AttributeError:
         raise  # attach debugger here ;)
@@ -202,23 +186,25 @@ def _transfer_field_singleton(
     if field.required and pydantic_field_on_parent and pydantic_field_on_parent.allow_none and value is None:
         raise Break(None)
 
-    if is_django_field and value and isinstance(orm_field.field, models.JSONField):
-        if issubclass(field.type_, BaseModel):
+    if plan.kind == KIND_JSON and value:
+        if plan.is_basemodel:
             if isinstance(value, dict):
                 value = field.type_.parse_obj(value)
 
+            elif orjson and field.type_.__config__.json_loads is json.loads:
+                value = field.type_.parse_obj(orjson.loads(value))
+
             else:
                 value = field.type_.parse_raw(value)
 
-        elif issubclass(field.type_, dict):
+        elif plan.is_dict:
             if isinstance(value, str):
-                value = json.loads(value)
+                value = orjson.loads(value) if orjson else json.loads(value)
 
         else:
             raise NotImplementedError
 
-    scopes = [AccessScope.from_str(audience) for audience in field.field_info.extra.get('scopes', [])]
-    if scopes:
+    if plan.read_scopes:
         try:
             access = access_ctx.get()
 
@@ -226,69 +212,124 @@ def _transfer_field_singleton(
             pass
 
         else:
-            read_scopes = [str(scope) for scope in scopes if scope.action == 'read']
-            if read_scopes:
-                if not access.token.has_audience(read_scopes):
-                    value = None
+            if not access.token.has_audience(plan.read_scopes):
+                value = None
 
-                else:
-                    if hasattr(django_obj, 'check_access'):
-                        for scope in scopes:
-                            if scope.action != 'read':
-                                continue
+            else:
+                if hasattr(django_obj, 'check_access'):
+                    for selector in plan.read_scope_selectors:
+                        try:
+                            django_obj.check_access(access, selector=selector)
 
-                            try:
-                                django_obj.check_access(access, selector=scope.selector)
+                        except AccessError:
+                            value = None
+
+    return value
 
-                            except AccessError:
-                                value = None
+
+def _transfer_field_scalar(
+    plan: FieldPlan,
+    django_obj: models.Model,
+    pydantic_field_on_parent: Optional[ModelField] = None,
+    filter_submodel: Optional[Mapping[Manager, models.Q]] = None,
+):
+    try:
+        # Loaded values are stored in the instance's __dict__, reading it directly skips the descriptor
+        value = django_obj.__dict__[plan.attname]
+
+    except KeyError:
+        value = getattr(django_obj, plan.attname)
+
+    if value is None and plan.field.required and pydantic_field_on_parent and pydantic_field_on_parent.allow_none:
+        raise Break(None)
 
     return value
 
 
-def _transfer_field(
-    field: ModelField,
+def _transfer_scalar_run(
+    run: ScalarRun,
     django_obj: models.Model,
     pydantic_field_on_parent: Optional[ModelField] = None,
     filter_submodel: Optional[Mapping[Manager, models.Q]] = None,
 ):
-    orm_method = field.field_info.extra.get('orm_method')
-    if orm_method:
-        return _compute_value_from_orm_method(
-            orm_method=orm_method,
-            field=field,
-            django_obj=django_obj,
-            filter_submodel=filter_submodel,
-        )
+    try:
+        values = run.getter(django_obj.__dict__)
 
-    orm_field = field.field_info.extra.get('orm_field')
-    if 'orm_field' in field.field_info.extra and field.field_info.extra['orm_field'] is None:
-        # Do not raise error when orm_field was explicitly set to None
-        return ...
+    except KeyError:
+        # Deferred fields are loaded through their descriptors
+        values = tuple(getattr(django_obj, attname) for attname in run.attnames)
 
-    if not orm_field and not (field.shape == SHAPE_SINGLETON and issubclass(field.type_, BaseModel)):
-        raise AttributeError("orm_field not found on %r (parent: %r)" % (field, pydantic_field_on_parent))
+    if run.required and pydantic_field_on_parent and pydantic_field_on_parent.allow_none:
+        for index in run.required:
+            if values[index] is None:
+                raise Break(None)
 
-    if field.shape == SHAPE_SINGLETON:
-        return _transfer_field_singleton(
-            field=field,
-            orm_field=orm_field,
-            django_obj=django_obj,
-            filter_submodel=filter_submodel,
-            pydantic_field_on_parent=pydantic_field_on_parent,
-        )
+    return zip(run.names, values)
+
+
+def _transfer_field_method(
+    plan: FieldPlan,
+    django_obj: models.Model,
+    pydantic_field_on_parent: Optional[ModelField] = None,
+    filter_submodel: Optional[Mapping[Manager, models.Q]] = None,
+):
+    return _compute_value_from_orm_method(
+        plan=plan,
+        django_obj=django_obj,
+        filter_submodel=filter_submodel,
+    )
+
+
+def _transfer_field_missing(
+    plan: FieldPlan,
+    django_obj: models.Model,
+    pydantic_field_on_parent: Optional[ModelField] = None,
+    filter_submodel: Optional[Mapping[Manager, models.Q]] = None,
+):
+    raise AttributeError("orm_field not found on %r (parent: %r)" % (plan.field, pydantic_field_on_parent))
+
+
+def _transfer_field_nested(
+    plan: FieldPlan,
+    django_obj: models.Model,
+    pydantic_field_on_parent: Optional[ModelField] = None,
+    filter_submodel: Optional[Mapping[Manager, models.Q]] = None,
+):
+    return _transfer_from_orm(
+        pydantic_cls=plan.field.type_,
+        django_obj=django_obj,
+        pydantic_field_on_parent=plan.field,
+        filter_submodel=filter_submodel,
+    )
 
-    if field.shape == SHAPE_LIST:
-        return _transfer_field_list(
-            field=field,
-            orm_field=orm_field,
-            django_obj=django_obj,
-            filter_submodel=filter_submodel,
-        )
 
+def _transfer_field_unsupported(
+    plan: FieldPlan,
+    django_obj: models.Model,
+    pydantic_field_on_parent: Optional[ModelField] = None,
+    filter_submodel: Optional[Mapping[Manager, models.Q]] = None,
+):
     raise NotImplementedError
 
 
+# Indexed by FieldPlan.kind
+_FIELD_TRANSFERS = (
+    _transfer_field_method,  # KIND_METHOD
+    None,  # KIND_SKIP, not part of read plans
+    _transfer_field_missing,  # KIND_MISSING
+    _transfer_field_nested,  # KIND_NESTED
+    _transfer_field_singleton,  # KIND_FIELD
+    _transfer_field_scalar,  # KIND_SCALAR
+    _transfer_field_singleton,  # KIND_JSON
+    _transfer_field_singleton,  # KIND_PROPERTY
+    _transfer_field_list,  # KIND_M2M
+    _transfer_field_list,  # KIND_REVERSE_M2O
+    _transfer_field_list,  # KIND_JSON_LIST
+    _transfer_field_unsupported,  # KIND_UNSUPPORTED
+    _transfer_scalar_run,  # KIND_SCALAR_RUN, returns (name, value) pairs
+)
+
+
 def _transfer_from_orm(
     pydantic_cls: Type[BaseModel],
     django_obj: models.Model,
@@ -303,25 +344,20 @@ def _transfer_from_orm(
     span.set_data('transfer_from_orm.django_parent_obj', django_parent_obj)
     span.set_data('transfer_from_orm.filter_submodel', filter_submodel)
 
+    transfers = _FIELD_TRANSFERS
+    steps, fields_set = get_read_plan(pydantic_cls)
     values = {}
-    field: ModelField
-    for field in pydantic_cls.__fields__.values():
-        try:
-            value = _transfer_field(
-                field=field,
-                django_obj=django_obj,
-                pydantic_field_on_parent=pydantic_field_on_parent,
-                filter_submodel=filter_submodel,
-            )
-
-        except Break as break_:
-            # The whole object should be None
-            return break_.args[0]
+    try:
+        for plan in steps:
+            if plan.kind == KIND_SCALAR_RUN:
+                values.update(_transfer_scalar_run(plan, django_obj, pydantic_field_on_parent))
 
-        else:
-            if value is ...:
-                continue
+            else:
+                values[plan.name] = transfers[plan.kind](plan, django_obj, pydantic_field_on_parent, filter_submodel)
 
-            values[field.name] = value
+    except Break as break_:
+        # The whole object should be None
+        return break_.args[0]
 
-    return pydantic_cls.construct(**values)
+    # Every step sets its fields, so construct does not need to collect them from values
+    return pydantic_cls.construct(_fields_set=set(fields_set), **values)
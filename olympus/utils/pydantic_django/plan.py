@@ -0,0 +1,216 @@
+from operator import attrgetter, itemgetter
+from typing import FrozenSet, Tuple, Type, Union
+from pydantic import BaseModel
+from pydantic.fields import ModelField, SHAPE_SINGLETON, SHAPE_LIST
+from django.db import models
+from django.db.models.query_utils import DeferredAttribute
+from django.db.models.fields.related_descriptors import ManyToManyDescriptor, ReverseManyToOneDescriptor
+from django.utils.functional import cached_property
+from ...schemas import AccessScope
+
+
+# Kinds of transfer operations, used as index into the handler tables of transfer_from_orm / transfer_to_orm
+KIND_METHOD = 0  # computed by orm_method
+KIND_SKIP = 1  # orm_field explicitly set to None
+KIND_MISSING = 2  # orm_field not set
+KIND_NESTED = 3  # pydantic submodel on the same django object
+KIND_FIELD = 4  # django model field with read scopes
+KIND_SCALAR = 5  # django model field without read scopes, its value is used as it is
+KIND_JSON = 6  # django JSONField
+KIND_PROPERTY = 7  # property or cached_property of the django model
+KIND_M2M = 8
+KIND_REVERSE_M2O = 9
+KIND_JSON_LIST = 10  # list stored in a django JSONField
+KIND_UNSUPPORTED = 11
+KIND_SCALAR_RUN = 12  # consecutive KIND_SCALAR fields, only used in read plans
+
+
+class FieldPlan:
+    """
+    Everything transfer_from_orm / transfer_to_orm need to know about a pydantic field, resolved from its field_info once
+    """
+    __slots__ = (
+        'field',
+        'name',
+        'is_basemodel',
+        'is_dict',
+        'orm_method',
+        'orm_field',
+        'orm_field_is_none',
+        'read_scopes',
+        'read_scope_selectors',
+        'attname',
+        'is_relation',
+        'kind',
+        'related_name',
+        'property_getter',
+        'sync_matching',
+    )
+
+    def __init__(self, field: ModelField):
+        extra = field.field_info.extra
+
+        self.field = field
+        self.name = field.name
+        type_ = field.type_
+        self.is_basemodel = isinstance(type_, type) and issubclass(type_, BaseModel)
+        self.is_dict = isinstance(type_, type) and issubclass(type_, dict)
+        self.orm_method = extra.get('orm_method')
+        self.orm_field = extra.get('orm_field')
+        # Do not raise error when orm_field was explicitly set to None
+        self.orm_field_is_none = 'orm_field' in extra and extra['orm_field'] is None
+
+        # Scopes are parsed here once instead of for every transferred object
+        read_scopes = [AccessScope.from_str(audience) for audience in extra.get('scopes', [])]
+        read_scopes = [scope for scope in read_scopes if scope.action == 'read']
+        self.read_scopes = tuple(str(scope) for scope in read_scopes)
+        self.read_scope_selectors = tuple(scope.selector for scope in read_scopes)
+
+        # Resolved from the django descriptors once, they do not change after the models are loaded
+        model_field = getattr(self.orm_field, 'field', None)
+        self.attname = getattr(model_field, 'attname', None)
+        self.is_relation = bool(getattr(model_field, 'is_relation', False))
+
+        self.kind = self._get_kind()
+        # Name of the related manager on the django object for KIND_REVERSE_M2O
+        self.related_name = self.orm_field.rel.name if self.kind == KIND_REVERSE_M2O else None
+        # Reads the property of a django object for KIND_PROPERTY
+        self.property_getter = None
+        if self.kind == KIND_PROPERTY:
+            self.property_getter = self.orm_field.fget if isinstance(self.orm_field, property) else self.orm_field.__get__
+
+        # How transfer_to_orm finds existing objects without id for KIND_REVERSE_M2O, a list becomes pairs of a getter
+        # for the (dotted) pydantic field path and the attname to match it against
+        self.sync_matching = extra.get('sync_matching')
+        if isinstance(self.sync_matching, list):
+            self.sync_matching = tuple(
+                (attrgetter(pydantic_field_name), match_orm_field.field.attname)
+                for pydantic_field_name, match_orm_field in self.sync_matching
+            )
+
+    def _get_kind(self) -> int:
+        field = self.field
+        orm_field = self.orm_field
+
+        if self.orm_method:
+            return KIND_METHOD
+
+        if self.orm_field_is_none:
+            return KIND_SKIP
+
+        if not orm_field:
+            if field.shape == SHAPE_SINGLETON and self.is_basemodel:
+                return KIND_NESTED
+
+            return KIND_MISSING
+
+        if field.shape == SHAPE_SINGLETON:
+            if isinstance(orm_field, (property, cached_property)):
+                return KIND_PROPERTY
+
+            if not self.attname:
+                return KIND_UNSUPPORTED
+
+            if isinstance(orm_field.field, models.JSONField):
+                return KIND_JSON
+
+            if self.attname and not self.read_scopes:
+                return KIND_SCALAR
+
+            return KIND_FIELD
+
+        if field.shape == SHAPE_LIST:
+            if isinstance(orm_field, ManyToManyDescriptor):
+                return KIND_M2M
+
+            if isinstance(orm_field, ReverseManyToOneDescriptor):
+                return KIND_REVERSE_M2O
+
+            if isinstance(orm_field, DeferredAttribute) and isinstance(orm_field.field, models.JSONField):
+                return KIND_JSON_LIST
+
+        return KIND_UNSUPPORTED
+
+
+def get_transfer_plan(pydantic_cls: Type[BaseModel]) -> Tuple[FieldPlan, ...]:
+    """
+    Returns the FieldPlan of every field of pydantic_cls, in field order.
+
+    The plan is built on first use and stored on the class itself, so it lives as long as the class does.
+    """
+    try:
+        # Not inherited, subclasses have their own fields
+        return pydantic_cls.__dict__['__orm_transfer_plan__']
+
+    except KeyError:
+        pass
+
+    plan = tuple(FieldPlan(field) for field in pydantic_cls.__fields__.values())
+    _store_on_class(pydantic_cls, '__orm_transfer_plan__', plan)
+    return plan
+
+
+def _store_on_class(pydantic_cls: Type[BaseModel], name: str, value):
+    try:
+        setattr(pydantic_cls, name, value)
+
+    except (AttributeError, TypeError):
+        # Generic aliases and the like do not take attributes, their plan is rebuilt on every call
+        pass
+
+
+class ScalarRun:
+    """
+    Consecutive KIND_SCALAR fields, read from the django object's __dict__ with a single itemgetter call
+    """
+    __slots__ = ('names', 'attnames', 'required', 'getter')
+
+    kind = KIND_SCALAR_RUN
+
+    def __init__(self, plans: Tuple[FieldPlan, ...]):
+        self.names = tuple(plan.name for plan in plans)
+        self.attnames = tuple(plan.attname for plan in plans)
+        # Indexes of required fields, which make the whole object None if their value is None and the parent allows it
+        self.required = tuple(index for index, plan in enumerate(plans) if plan.field.required)
+        self.getter = itemgetter(*self.attnames)
+
+
+def get_read_plan(pydantic_cls: Type[BaseModel]) -> Tuple[Tuple[Union[FieldPlan, ScalarRun], ...], FrozenSet[str]]:
+    """
+    Returns the steps of transfer_from_orm for pydantic_cls: the transfer plan without the skipped fields and with
+    consecutive plain model fields merged into a ScalarRun. Also returns the names of the fields these steps set.
+    """
+    try:
+        return pydantic_cls.__dict__['__orm_read_plan__']
+
+    except KeyError:
+        pass
+
+    steps = []
+    scalars = []
+
+    def add_scalars():
+        if len(scalars) > 1:
+            steps.append(ScalarRun(tuple(scalars)))
+
+        else:
+            steps.extend(scalars)
+
+        scalars.clear()
+
+    for plan in get_transfer_plan(pydantic_cls):
+        if plan.kind == KIND_SCALAR:
+            scalars.append(plan)
+            continue
+
+        add_scalars()
+        if plan.kind != KIND_SKIP:
+            steps.append(plan)
+
+    add_scalars()
+    read_plan = (
+        tuple(steps),
+        frozenset(plan.name for plan in get_transfer_plan(pydantic_cls) if plan.kind != KIND_SKIP),
+    )
+    _store_on_class(pydantic_cls, '__orm_read_plan__', read_plan)
+    return read_plan
@@ -6,13 +6,13 @@ from fastapi.exceptions import RequestValidationError
 from pydantic import BaseModel, validate_model, SecretStr
 from pydantic.fields import SHAPE_SINGLETON, SHAPE_LIST, Undefined
 from django.db import models
-from django.db.models.fields.related_descriptors import ManyToManyDescriptor, ReverseManyToOneDescriptor
 from django.db.transaction import atomic
 from ...schemas import Access
 from ..sentry import instrument_span, span as span_ctx
 from ..pydantic import Reference
 from ..asyncio import is_async
 from .checks import check_field_access
+from .plan import FieldPlan, get_transfer_plan
 
 if os.getenv('USE_ASYNCIO'):
     from ..asyncio import sync_to_async
@@ -40,7 +40,8 @@ def transfer_to_orm(
     access: Optional[Access] = None,
     created_submodels: Optional[list] = None,
     _just_return_objs: bool = False,
-) -> Optional[Tuple[List[models.Model], List[models.Model]]]:
+    _existing_object_ids: Optional[dict] = None,
+) -> Optional[Tuple[List[models.Model], List[models.QuerySet]]]:
     """
     Transfers the field contents of pydantic_obj to django_obj.
     For this to work it is required to have orm_field set on all of the pydantic_obj's fields, which has to point to the django model attribute.
@@ -61,7 +62,7 @@ def transfer_to_orm(
     ```
     """
     if is_async():
-        return sync_to_async(transfer_to_orm)(
+        return transfer_to_orm_async(
             pydantic_obj=pydantic_obj,
             django_obj=django_obj,
             action=action,
@@ -84,226 +85,385 @@ def transfer_to_orm(
     if not action:
         warnings.warn("Use transfer_to_orm with kwarg action", category=DeprecationWarning)
 
-    subobjects = created_submodels or []
-    existing_objects = []
-
     if access:
         check_field_access(pydantic_obj, access)
 
-    pydantic_values: Optional[dict] = pydantic_obj.dict(exclude_unset=True) if exclude_unset else None
+    transfer = _TransferToOrm(
+        pydantic_obj=pydantic_obj,
+        django_obj=django_obj,
+        action=action,
+        exclude_unset=exclude_unset,
+        access=access,
+        subobjects=created_submodels or [],
+        # Shared with the nested transfers, nothing is saved before the whole transfer is done
+        existing_object_ids={} if _existing_object_ids is None else _existing_object_ids,
+    )
+    field_transfers = _FIELD_TRANSFERS
+    for plan in get_transfer_plan(pydantic_obj.__class__):
+        field_transfer = field_transfers[plan.kind]
+        if field_transfer is not None:
+            field_transfer(plan, transfer)
+
+    subobjects = transfer.subobjects
+    existing_objects = transfer.existing_objects
 
-    def populate_default(pydantic_cls, django_obj):
-        for key, field in pydantic_cls.__fields__.items():
-            orm_field = field.field_info.extra.get('orm_field')
-            if not orm_field and issubclass(field.type_, BaseModel):
-                populate_default(field.type_, django_obj)
+    if subobjects and not action:
+        raise AssertionError('action is not defined but subobjects exist')
 
-            else:
-                if 'orm_field' in field.field_info.extra and field.field_info.extra['orm_field'] is None:
-                    # Do not raise error when orm_field was explicitly set to None
-                    continue
-
-                assert orm_field, "orm_field not set on %r of %r" % (field, pydantic_cls)
-
-                setattr(
-                    django_obj,
-                    orm_field.field.attname,
-                    field.field_info.default if field.field_info.default is not Undefined and field.field_info.default is not ... else None,
-                )
-
-    for key, field in pydantic_obj.__fields__.items():
-        orm_method = field.field_info.extra.get('orm_method')
-        if orm_method:
-            if exclude_unset and key not in pydantic_values:
-                continue
+    if _just_return_objs:
+        return subobjects, existing_objects
 
-            value = getattr(pydantic_obj, field.name)
-            if isinstance(value, SecretStr):
-                value = value.get_secret_value()
+    if action in (TransferAction.CREATE, TransferAction.SYNC, TransferAction.NO_SUBOBJECTS) and created_submodels is None:
+        with atomic():
+            django_obj.save()
+
+            if action in (TransferAction.CREATE, TransferAction.SYNC):
+                if action == TransferAction.SYNC:
+                    for queryset in existing_objects:
+                        if queryset.model.delete is models.Model.delete:
+                            # Deleted in one go, pre_delete / post_delete are still sent for every object
+                            queryset.delete()
 
-            orm_method(django_obj, value)
-            continue
+                        else:
+                            for obj in queryset:
+                                obj.delete()
+
+                for obj in subobjects:
+                    obj.save()
 
-        orm_field = field.field_info.extra.get('orm_field')
-        if not orm_field:
-            if 'orm_field' in field.field_info.extra and field.field_info.extra['orm_field'] is None:
+
+class _TransferToOrm:
+    """
+    State of a single transfer_to_orm call, passed to the field transfers below
+    """
+    __slots__ = (
+        'pydantic_obj',
+        'django_obj',
+        'action',
+        'exclude_unset',
+        'access',
+        'fields_set',
+        'subobjects',
+        'existing_objects',
+        'existing_object_ids',
+    )
+
+    def __init__(
+        self,
+        pydantic_obj: BaseModel,
+        django_obj: models.Model,
+        action: Optional[TransferAction],
+        exclude_unset: bool,
+        access: Optional[Access],
+        subobjects: List[models.Model],
+        existing_object_ids: dict,
+    ):
+        self.pydantic_obj = pydantic_obj
+        self.django_obj = django_obj
+        self.action = action
+        self.exclude_unset = exclude_unset
+        self.access = access
+        self.fields_set: Optional[set] = pydantic_obj.__fields_set__ if exclude_unset else None
+        self.subobjects = subobjects
+        self.existing_objects: List[models.QuerySet] = []
+        self.existing_object_ids = existing_object_ids
+
+    def is_unset(self, key: str) -> bool:
+        return self.exclude_unset and key not in self.fields_set
+
+    def get_existing_object_ids(self, related_model: Type[models.Model], obj_fields: dict) -> set:
+        key = (related_model, *((name, id(value)) for name, value in obj_fields.items()))
+        try:
+            object_ids = self.existing_object_ids[key]
+
+        except KeyError:
+            object_ids = self.existing_object_ids[key] = set(related_model.objects.filter(**obj_fields).values_list('id', flat=True))
+
+        # Every field discards its matched objects from its own copy
+        return set(object_ids)
+
+    def transfer_subobject(self, pydantic_obj: BaseModel, django_obj: models.Model):
+        subobjects, existing_objects = transfer_to_orm(
+            pydantic_obj=pydantic_obj,
+            django_obj=django_obj,
+            exclude_unset=self.exclude_unset,
+            access=self.access,
+            action=self.action,
+            _just_return_objs=True,
+            _existing_object_ids=self.existing_object_ids,
+        )
+        self.subobjects.extend(subobjects)
+        self.existing_objects.extend(existing_objects)
+
+
+def _populate_default(pydantic_cls: Type[BaseModel], django_obj: models.Model):
+    for plan in get_transfer_plan(pydantic_cls):
+        field = plan.field
+        if not plan.orm_field and plan.is_basemodel:
+            _populate_default(field.type_, django_obj)
+
+        else:
+            if plan.orm_field_is_none:
                 # Do not raise error when orm_field was explicitly set to None
                 continue
 
-            if not (field.shape == SHAPE_SINGLETON and issubclass(field.type_, BaseModel)):
-                raise AttributeError("orm_field not found on %r" % field)
+            assert plan.orm_field, "orm_field not set on %r of %r" % (field, pydantic_cls)
 
-        value = getattr(pydantic_obj, field.name)
-        if field.shape == SHAPE_SINGLETON:
-            if not orm_field and issubclass(field.type_, BaseModel):
-                if value is None:
-                    if exclude_unset and key not in pydantic_values:
-                        continue
+            setattr(
+                django_obj,
+                plan.attname,
+                field.field_info.default if field.field_info.default is not Undefined and field.field_info.default is not ... else None,
+            )
 
-                    populate_default(field.type_, django_obj)
 
-                elif isinstance(value, BaseModel):
-                    sub_transfer = transfer_to_orm(pydantic_obj=value, django_obj=django_obj, exclude_unset=exclude_unset, access=access, action=action, _just_return_objs=True)
-                    subobjects += sub_transfer[0]
-                    existing_objects += sub_transfer[1]
+def _transfer_field_method(plan: FieldPlan, transfer: _TransferToOrm):
+    if transfer.is_unset(plan.name):
+        return
 
-                else:
-                    raise NotImplementedError
+    value = getattr(transfer.pydantic_obj, plan.name)
+    if isinstance(value, SecretStr):
+        value = value.get_secret_value()
 
-            else:
-                if exclude_unset and key not in pydantic_values:
-                    continue
+    plan.orm_method(transfer.django_obj, value)
 
-                if orm_field.field.is_relation and isinstance(value, models.Model):
-                    value = value.pk
 
-                if isinstance(orm_field.field, models.JSONField) and value:
-                    if isinstance(value, BaseModel):
-                        value = value.dict()
+def _transfer_field_missing(plan: FieldPlan, transfer: _TransferToOrm):
+    raise AttributeError("orm_field not found on %r" % plan.field)
 
-                    elif isinstance(value, dict):
-                        pass
 
-                    else:
-                        raise NotImplementedError
+def _transfer_field_nested(plan: FieldPlan, transfer: _TransferToOrm):
+    value = getattr(transfer.pydantic_obj, plan.name)
+    if value is None:
+        if transfer.is_unset(plan.name):
+            return
 
-                setattr(django_obj, orm_field.field.attname, value)
+        _populate_default(plan.field.type_, transfer.django_obj)
 
-        elif field.shape == SHAPE_LIST:
-            if not value:
-                continue
+    elif isinstance(value, BaseModel):
+        transfer.transfer_subobject(value, transfer.django_obj)
 
-            elif isinstance(orm_field, ManyToManyDescriptor):
-                relatedmanager = getattr(django_obj, orm_field.field.attname)
-                related_model = relatedmanager.through
-                obj_fields = {relatedmanager.source_field_name: django_obj}
-                existing_object_ids = set()
-                if action == TransferAction.SYNC:
-                    existing_object_ids = set(related_model.objects.filter(**obj_fields).values_list('id', flat=True))
+    else:
+        raise NotImplementedError
 
-                for val in value:
-                    def get_subobj(force_create: bool = False):
-                        obj_manytomany_fields = {**obj_fields}
-                        if getattr(val, 'id', None):
-                            obj_manytomany_fields[relatedmanager.target_field.attname] = val.id
 
-                        else:
-                            raise NotImplementedError
+def _transfer_field_singleton(plan: FieldPlan, transfer: _TransferToOrm):
+    if transfer.is_unset(plan.name):
+        return
 
-                        if force_create or action == TransferAction.CREATE:
-                            return related_model(**obj_manytomany_fields)
+    value = getattr(transfer.pydantic_obj, plan.name)
+    if plan.is_relation and isinstance(value, models.Model):
+        value = value.pk
 
-                        elif action == TransferAction.SYNC:
-                            try:
-                                return related_model.objects.get(**obj_manytomany_fields)
+    setattr(transfer.django_obj, plan.attname, value)
 
-                            except related_model.DoesNotExist:
-                                return get_subobj(force_create=True)
 
-                        else:
-                            raise NotImplementedError
+def _transfer_field_json(plan: FieldPlan, transfer: _TransferToOrm):
+    if transfer.is_unset(plan.name):
+        return
 
-                    sub_obj = get_subobj()
-                    existing_object_ids.discard(sub_obj.id)
-                    subobjects.append(sub_obj)
-                    sub_transfer = transfer_to_orm(val, sub_obj, exclude_unset=exclude_unset, access=access, action=action, _just_return_objs=True)
-                    subobjects += sub_transfer[0]
-                    existing_objects += sub_transfer[1]
+    value = getattr(transfer.pydantic_obj, plan.name)
+    if value:
+        if isinstance(value, BaseModel):
+            value = value.dict()
 
-                existing_objects += related_model.objects.filter(id__in=list(existing_object_ids))
+        elif not isinstance(value, (dict, list)):
+            # Dicts and lists are serialized by the JSONField itself on save
+            raise NotImplementedError
 
-            elif isinstance(orm_field, ReverseManyToOneDescriptor):
-                relatedmanager = getattr(django_obj, orm_field.rel.name)
-                related_model: Type[models.Model] = relatedmanager.field.model
-                obj_fields = {relatedmanager.field.name: django_obj}
+    setattr(transfer.django_obj, plan.attname, value)
 
-                existing_object_ids = set()
-                if action == TransferAction.SYNC:
-                    existing_object_ids = set(related_model.objects.filter(**obj_fields).values_list('id', flat=True))
 
-                val: BaseModel
-                for val in value:
-                    def get_subobj(force_create: bool = False):
-                        if action == TransferAction.SYNC and not getattr(val, 'id', None) and not 'sync_matching' in field.field_info.extra:
-                            force_create = True
+def _transfer_field_m2m(plan: FieldPlan, transfer: _TransferToOrm):
+    value = getattr(transfer.pydantic_obj, plan.name)
+    if not value:
+        return
 
-                        if force_create or action == TransferAction.CREATE:
-                            create_fields = {}
-                            if getattr(val, 'id', None):
-                                create_fields['id'] = getattr(val, 'id', None)
+    action = transfer.action
+    django_obj = transfer.django_obj
+    relatedmanager = getattr(django_obj, plan.attname)
+    related_model = relatedmanager.through
+    obj_fields = {relatedmanager.source_field_name: django_obj}
+    existing_object_ids = set()
+    if action == TransferAction.SYNC:
+        existing_object_ids = transfer.get_existing_object_ids(related_model, obj_fields)
 
-                            return related_model(**obj_fields, **create_fields)
+    for val in value:
+        def get_subobj(force_create: bool = False):
+            obj_manytomany_fields = {**obj_fields}
+            if getattr(val, 'id', None):
+                obj_manytomany_fields[relatedmanager.target_field.attname] = val.id
 
-                        elif action == TransferAction.SYNC:
-                            try:
-                                if getattr(val, 'id', None):
-                                    return related_model.objects.get(id=val.id, **obj_fields)
+            else:
+                raise NotImplementedError
 
-                                elif 'sync_matching' in field.field_info.extra:
-                                    matching = field.field_info.extra['sync_matching']
-                                    if isinstance(matching, list):
-                                        matching_search = models.Q()
-                                        pydantic_field_name: str
-                                        match_orm_field: models.Field
-                                        for pydantic_field_name, match_orm_field in matching:
-                                            match_value = val
-                                            for _field in pydantic_field_name.split('.'):
-                                                match_value = getattr(match_value, _field)
+            if force_create or action == TransferAction.CREATE:
+                return related_model(**obj_manytomany_fields)
 
-                                            if isinstance(match_value, Reference):
-                                                match_value = match_value.id
+            elif action == TransferAction.SYNC:
+                try:
+                    return related_model.objects.get(**obj_manytomany_fields)
 
-                                            matching_search &= models.Q(**{match_orm_field.field.attname: match_value})
+                except related_model.DoesNotExist:
+                    return get_subobj(force_create=True)
 
-                                        return related_model.objects.filter(**obj_fields).get(matching_search)
+            else:
+                raise NotImplementedError
 
-                                    elif isinstance(matching, callable):
-                                        raise NotImplementedError
+        sub_obj = get_subobj()
+        existing_object_ids.discard(sub_obj.id)
+        transfer.subobjects.append(sub_obj)
+        transfer.transfer_subobject(val, sub_obj)
 
-                                    else:
-                                        raise NotImplementedError
+    if existing_object_ids:
+        transfer.existing_objects.append(related_model.objects.filter(id__in=existing_object_ids))
 
-                                else:
-                                    raise NotImplementedError
 
-                            except related_model.DoesNotExist:
-                                return get_subobj(force_create=True)
+def _get_match_key(matching: tuple, match_fields: List[models.Field], val: BaseModel) -> tuple:
+    """
+    Returns the values of val to match an existing object by, converted like the values read from the database
+    """
+    match_key = []
+    for (get_match_value, _match_attname), match_field in zip(matching, match_fields):
+        match_value = get_match_value(val)
+        if isinstance(match_value, Reference):
+            match_value = match_value.id
 
-                        else:
-                            raise NotImplementedError
+        if isinstance(match_value, models.Model):
+            match_value = match_value.pk
 
-                    sub_obj = get_subobj()
-                    existing_object_ids.discard(sub_obj.id)
-                    subobjects.append(sub_obj)
-                    sub_transfer = transfer_to_orm(val, sub_obj, exclude_unset=exclude_unset, access=access, action=action, _just_return_objs=True)
-                    subobjects += sub_transfer[0]
-                    existing_objects += sub_transfer[1]
+        match_key.append(match_field.to_python(match_value))
 
-                existing_objects += related_model.objects.filter(id__in=list(existing_object_ids))
+    return tuple(match_key)
 
-            else:
-                raise NotImplementedError
 
-        else:
-            raise NotImplementedError
+def _get_matched_objects(related_model: Type[models.Model], obj_fields: dict, matching: tuple, match_keys: list) -> dict:
+    """
+    Loads the existing objects matching any of match_keys with a single query, by their match key.
+    Keys matching more than one object map to None.
+    """
+    match_attnames = [match_attname for _get_match_value, match_attname in matching]
+    matching_search = models.Q()
+    for match_key in match_keys:
+        matching_search |= models.Q(**dict(zip(match_attnames, match_key)))
+
+    matched_objects = {}
+    for obj in related_model.objects.filter(**obj_fields).filter(matching_search):
+        match_key = tuple(getattr(obj, match_attname) for match_attname in match_attnames)
+        matched_objects[match_key] = None if match_key in matched_objects else obj
+
+    return matched_objects
+
+
+def _transfer_field_reverse_m2o(plan: FieldPlan, transfer: _TransferToOrm):
+    value = getattr(transfer.pydantic_obj, plan.name)
+    if not value:
+        return
+
+    action = transfer.action
+    relatedmanager = getattr(transfer.django_obj, plan.related_name)
+    related_model: Type[models.Model] = relatedmanager.field.model
+    obj_fields = {relatedmanager.field.name: transfer.django_obj}
+
+    existing_object_ids = set()
+    if action == TransferAction.SYNC:
+        existing_object_ids = transfer.get_existing_object_ids(related_model, obj_fields)
+
+    matching = plan.sync_matching
+    match_keys = [None] * len(value)
+    matched_objects = {}
+    if action == TransferAction.SYNC and isinstance(matching, tuple):
+        # Objects without id are matched with one query for the whole list instead of one per object
+        match_fields = [related_model._meta.get_field(match_attname) for _get_match_value, match_attname in matching]
+        for index, val in enumerate(value):
+            if not getattr(val, 'id', None):
+                match_keys[index] = _get_match_key(matching, match_fields, val)
+
+        keys_to_match = [match_key for match_key in match_keys if match_key is not None]
+        if keys_to_match:
+            matched_objects = _get_matched_objects(related_model, obj_fields, matching, keys_to_match)
+
+    val: BaseModel
+    for val, match_key in zip(value, match_keys):
+        def get_subobj(force_create: bool = False):
+            if action == TransferAction.SYNC and not getattr(val, 'id', None) and matching is None:
+                force_create = True
+
+            if force_create or action == TransferAction.CREATE:
+                create_fields = {}
+                if getattr(val, 'id', None):
+                    create_fields['id'] = getattr(val, 'id', None)
+
+                return related_model(**obj_fields, **create_fields)
+
+            elif action == TransferAction.SYNC:
+                try:
+                    if getattr(val, 'id', None):
+                        return related_model.objects.get(id=val.id, **obj_fields)
+
+                    elif isinstance(matching, tuple):
+                        try:
+                            matched_obj = matched_objects[match_key]
+
+                        except KeyError:
+                            return get_subobj(force_create=True)
+
+                        if matched_obj is None:
+                            raise related_model.MultipleObjectsReturned(
+                                "get() returned more than one %s matching %r" % (related_model._meta.object_name, match_key),
+                            )
+
+                        return matched_obj
 
-    if subobjects and not action:
-        raise AssertionError('action is not defined but subobjects exist')
+                    else:
+                        raise NotImplementedError("sync_matching %r of %r is not supported" % (matching, plan.field))
 
-    if _just_return_objs:
-        return subobjects, existing_objects
+                except related_model.DoesNotExist:
+                    return get_subobj(force_create=True)
 
-    if action in (TransferAction.CREATE, TransferAction.SYNC, TransferAction.NO_SUBOBJECTS) and created_submodels is None:
-        with atomic():
-            django_obj.save()
+            else:
+                raise NotImplementedError
 
-            if action in (TransferAction.CREATE, TransferAction.SYNC):
-                if action == TransferAction.SYNC:
-                    for obj in existing_objects:
-                        obj.delete()
+        sub_obj = get_subobj()
+        existing_object_ids.discard(sub_obj.id)
+        transfer.subobjects.append(sub_obj)
+        transfer.transfer_subobject(val, sub_obj)
+
+    if existing_object_ids:
+        transfer.existing_objects.append(related_model.objects.filter(id__in=existing_object_ids))
+
+
+def _transfer_field_unsupported(plan: FieldPlan, transfer: _TransferToOrm):
+    shape = plan.field.shape
+    if shape == SHAPE_SINGLETON:
+        if transfer.is_unset(plan.name):
+            return
+
+    elif shape == SHAPE_LIST:
+        if not getattr(transfer.pydantic_obj, plan.name):
+            return
+
+    raise NotImplementedError
+
+
+# Indexed by FieldPlan.kind
+_FIELD_TRANSFERS = (
+    _transfer_field_method,  # KIND_METHOD
+    None,  # KIND_SKIP
+    _transfer_field_missing,  # KIND_MISSING
+    _transfer_field_nested,  # KIND_NESTED
+    _transfer_field_singleton,  # KIND_FIELD
+    _transfer_field_singleton,  # KIND_SCALAR
+    _transfer_field_json,  # KIND_JSON
+    _transfer_field_unsupported,  # KIND_PROPERTY, properties cannot be written
+    _transfer_field_m2m,  # KIND_M2M
+    _transfer_field_reverse_m2o,  # KIND_REVERSE_M2O
+    _transfer_field_unsupported,  # KIND_JSON_LIST
+    _transfer_field_unsupported,  # KIND_UNSUPPORTED
+)
 
-                for obj in subobjects:
-                    obj.save()
+
+# Runs a whole transfer, including all nested transfers, in a single sync_to_async call
+transfer_to_orm_async = sync_to_async(transfer_to_orm)
 
 
 async def update_orm(model: Type[BaseModel], orm_obj: models.Model, input: BaseModel, *, access: Optional[Access] = None) -> BaseModel:
@@ -337,5 +497,6 @@ async def update_orm(model: Type[BaseModel], orm_obj: models.Model, input: BaseM
     if validation_error:
         raise RequestValidationError(validation_error.raw_errors)
 
-    transfer_to_orm(data, orm_obj)
+    # transfer_to_orm only returns an awaitable inside the event loop, the async variant always does
+    await transfer_to_orm_async(data, orm_obj)
     return data
@@ -8,7 +8,14 @@ def dict_resolve_obj_to_id(input):
     if not isinstance(input, dict):
         return input
 
-    for key, value in input.items():
-        input[key] = dict_resolve_obj_to_id(value)
+    stack = [input]
+    while stack:
+        current = stack.pop()
+        for key, value in current.items():
+            if isinstance(value, models.Model):
+                current[key] = value.pk
+
+            elif isinstance(value, dict):
+                stack.append(value)
 
     return input
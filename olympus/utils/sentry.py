@@ -1,7 +1,7 @@
 import threading
 from functools import wraps
 from typing import Callable, Optional, Union, List
-from sentry_sdk import start_span, capture_exception as sentry_capture_exception, set_tag
+from sentry_sdk import Hub, start_span, capture_exception as sentry_capture_exception, set_tag
 from sentry_sdk.tracing import Span
 from contextvars import ContextVar
 
@@ -19,16 +19,24 @@ def instrument_span(op: str, description: Optional[Union[str, Callable]] = None,
             except LookupError:
                 parent_span = None
 
-            if parent_span and not force_new_span:
+            is_child = parent_span and not force_new_span
+
+            _description = description
+            if callable(description):
+                # Only build the description if the span can actually be sent
+                is_recorded = parent_span.sampled if is_child else Hub.current.client is not None
+                _description = description(*args, **kwargs) if is_recorded else None
+
+            if is_child:
                 _span = parent_span.start_child(
-                    description=description(*args, **kwargs) if callable(description) else description,
+                    description=_description,
                     **instrument_kwargs,
                 )
 
             else:
                 _span = start_span(
                     op=op,
-                    description=description(*args, **kwargs) if callable(description) else description,
+                    description=_description,
                     **instrument_kwargs,
                 )
 
@@ -0,0 +1,13 @@
+import django
+from django.conf import settings
+
+
+def pytest_configure(config):
+    if not settings.configured:
+        settings.configure(
+            INSTALLED_APPS=['django.contrib.contenttypes'],
+            DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}},
+            USE_TZ=True,
+        )
+
+    django.setup()
@@ -0,0 +1,37 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+from typing import Optional
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, Field
+import pytest
+from olympus import schemas
+from olympus.handlers import error
+
+
+class Location(BaseModel):
+    field_name: str = Field(alias='fieldName')
+    checked_at: Optional[datetime] = Field(None, alias='checkedAt')
+
+
+class Detail(BaseModel):
+    error_location: Location = Field(alias='errorLocation')
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_respond_details_uses_aliases_of_nested_detail_models(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(error, 'orjson', None)
+
+    content = schemas.Error(
+        type='ValidationError',
+        detail=Detail(errorLocation=Location(fieldName='name', checkedAt=datetime(2021, 1, 1, tzinfo=timezone.utc))),
+    )
+    response = asyncio.run(error.respond_details(Request({'type': 'http'}), content, status_code=422))
+
+    assert response.status_code == 422
+    assert json.loads(response.body) == {'detail': jsonable_encoder(content)}
+    assert json.loads(response.body)['detail']['detail'] == {
+        'errorLocation': {'fieldName': 'name', 'checkedAt': '2021-01-01T00:00:00+00:00'},
+    }
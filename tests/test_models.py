@@ -0,0 +1,90 @@
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+import pytest
+from olympus.exceptions import AccessError
+from olympus.models import AccessMixin, ModelAtomicSave
+from olympus.schemas import Access, AccessToken
+
+
+class Item(ModelAtomicSave):
+    name = models.CharField(max_length=20)
+
+    class Meta:
+        app_label = 'olympus_tests'
+
+
+class ShoutingItem(Item):
+    def save(self, *args, **kwargs):
+        self.name += '!'
+        return super().save(*args, **kwargs)
+
+    class Meta:
+        app_label = 'olympus_tests'
+        proxy = True
+
+
+@pytest.fixture(scope='module', autouse=True)
+def item_table():
+    with connection.schema_editor() as schema_editor:
+        schema_editor.create_model(Item)
+
+    yield
+
+    with connection.schema_editor() as schema_editor:
+        schema_editor.delete_model(Item)
+
+
+def test_bulk_save_calls_overridden_save():
+    ShoutingItem.bulk_save([ShoutingItem(name='a'), ShoutingItem(name='b')])
+
+    assert sorted(Item.objects.values_list('name', flat=True)) == ['a!', 'b!']
+
+
+def test_bulk_save_uses_a_single_transaction():
+    with CaptureQueriesContext(connection) as queries:
+        Item.bulk_save([Item(name='c'), Item(name='d'), Item(name='e')])
+
+    assert not [query for query in queries.captured_queries if 'SAVEPOINT' in query['sql']]
+
+
+def test_save_outside_bulk_save_is_atomic():
+    with CaptureQueriesContext(connection) as queries:
+        Item(name='f').save()
+
+    assert queries.captured_queries[0]['sql'] == 'BEGIN'
+
+
+class TenantProperty(AccessMixin):
+    @property
+    def tenant_id(self):
+        raise AttributeError('tenant_id')
+
+    def _check_access_any(self, access, action=None):
+        pass
+
+    class Meta:
+        app_label = 'olympus_tests'
+
+
+class TenantField(AccessMixin):
+    tenant_id = models.CharField(max_length=20)
+
+    def _check_access_any(self, access, action=None):
+        pass
+
+    class Meta:
+        app_label = 'olympus_tests'
+
+
+def _access(tenant_id: str) -> Access:
+    return Access.construct(token=AccessToken.construct(ten=tenant_id))
+
+
+def test_check_access_treats_raising_tenant_id_property_as_no_tenant():
+    TenantProperty().check_access(_access('tenant'), selector='any')
+
+
+def test_check_access_compares_tenant_id_field():
+    TenantField(tenant_id='tenant').check_access(_access('tenant'), selector='any')
+    with pytest.raises(AccessError):
+        TenantField(tenant_id='other').check_access(_access('tenant'), selector='any')